@@ -5,20 +5,19 @@ class ParseError(Error):
 
 def parse_xy_coords(path):
     with ParseError.add_info("path: {path}", path=path):
-        lines = _lines_from_file(path)
-        coords = []
+        with _open_file(path) as f:
+            coords = []
 
-        for i, line in enumerate(lines, 1):
-            with ParseError.add_info("line #{i}: {line}", i=i, line=line):
-                coord = _coord_from_line(line)
-                coords.append(coord)
+            for i, line in enumerate(f, 1):
+                with ParseError.add_info("line #{i}: {line}", i=i, line=line):
+                    coord = _coord_from_line(line)
+                    coords.append(coord)
 
-        return coords
+            return coords
 
-def _lines_from_file(path):
+def _open_file(path):
     try:
-        with open(path) as f:
-            return f.readlines()
+        return open(path)
 
     except FileNotFoundError:
         err = ParseError("can't read file")
@@ -30,8 +29,9 @@ def _coord_from_line(line):
 
     if len(fields) != 2:
         raise ParseError(
-                lambda e: f"expected 2 fields, found {len(e.fields)}",
+                "expected 2 fields, found {num_fields}",
                 fields=fields,
+                num_fields=len(fields),
         )
 
     coord = []
@@ -85,3 +85,36 @@ def test_parse_xy_coords_err_3(tmp_path):
     assert err.match(r"path: .*input\.xy")
     assert err.match(r"line #1: 1")
     assert err.match(r"expected a number, not 'b'")
+
+def test_parse_xy_coords_err_4(tmp_path):
+    p = tmp_path / 'input.xy'
+    p.write_text("1 2\n3 4 5 6")
+
+    with pytest.raises(ParseError) as err:
+        parse_xy_coords(p)
+
+    assert err.match(r"path: .*input\.xy")
+    assert err.match(r"line #2: 3 4 5 6")
+    assert err.match(r"expected 2 fields, found 4")
+
+def test_parse_xy_coords_closes_file(tmp_path, monkeypatch):
+    p = tmp_path / 'input.xy'
+    p.write_text("1 2\n3 b\n")
+    files = []
+    real_open = open
+
+    def open_spy(*args, **kwargs):
+        f = real_open(*args, **kwargs)
+        files.append(f)
+        return f
+
+    monkeypatch.setitem(globals(), 'open', open_spy)
+
+    # Keep the exception (and therefore its traceback) alive while checking 
+    # that the file was closed.
+    with pytest.raises(ParseError) as err:
+        parse_xy_coords(p)
+
+    assert err.match(r"line #2: 3 b")
+    assert len(files) == 1
+    assert files[0].closed
@@ -456,6 +456,37 @@ def test_add_info_nested_err():
     with pytest.raises(KeyError):
         a1.info_strs
 
+def test_add_info_decorator():
+
+    class A(Error):
+        pass
+
+    @A.add_info("in f: {x}", x=1)
+    def f():
+        raise A("boom")
+
+    with pytest.raises(A) as err:
+        f()
+
+    assert err.value.info_strs == ["in f: 1"]
+    assert str(err.value) == "boom\n• in f: 1\n"
+
+    # The info should only be added while the function is running.
+    assert A().info_strs == []
+
+def test_add_info_data_copied():
+
+    class A(Error):
+        pass
+
+    with A.add_info(a=1):
+        a1 = A()
+        a1.nested_data.flatten(0).a = 2
+        a2 = A()
+
+    assert a1.data == {'a': 2}
+    assert a2.data == {'a': 1}
+
 def test_put_info():
     e = Error(a=1, z=-1)
     e.info += "a={a}"
@@ -496,6 +527,23 @@ Brief
 • Hint
 """
 
+def test_str_multiline():
+    e = Error("Brief\nline 2")
+    e.info += "Info\nline 2"
+    e.blame += "Blame\nline 2"
+    e.hints += "Hint\nline 2"
+
+    assert str(e) == """\
+Brief
+line 2
+• Info
+  line 2
+✖ Blame
+  line 2
+• Hint
+  line 2
+"""
+
 def test_str_custom_bullet():
 
     class A(Error):
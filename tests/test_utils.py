@@ -68,6 +68,8 @@ def test_list_iadd():
             ('', {}, ''),
             ('a', {}, 'a'),
             ('{a}', {'a': 1}, '1'),
+            ('{{a}}', {}, '{a}'),
+            ('a}}', {}, 'a}'),
             (lambda d: f'{d["a"] + 1}', {'a': 1}, '2'),
         ],
 )
@@ -22,7 +22,7 @@ def test_data_view_get_set_del():
     assert v.a == v['a'] == 1
     assert v.b == v['b'] == 2
 
-    with pytest.raises(AttributeError):
+    with pytest.raises(AttributeError, match="z"):
         v.z
     with pytest.raises(KeyError):
         v['z']
@@ -129,14 +129,3 @@ def test_info_view():
 
     v[:] = ['e', 'f']
     assert p == [(-1, 'e'), (-1, 'f')]
-
-def test_reverse_view():
-    l = [1, 2]
-    v = reverse_view(l)
-
-    assert repr(v) == '[2, 1]'
-    assert len(v) == 2
-    assert v[0] == 2
-    assert v[1] == 1
-    assert list(v) == [2, 1]
-
@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 
 import textwrap
-from shutil import get_terminal_size
-from contextlib import contextmanager
-from collections import ChainMap
-from traceback import format_exc
+from contextlib import ContextDecorator
 from .views import data_view, nested_data_view, info_view
 from .utils import list_iadd, property_iadd, eval_template, flatten
 
@@ -49,7 +46,6 @@ class Error(Exception):
     "The prefix to use for each `hints` message in the formatted error."
 
     @classmethod
-    @contextmanager
     def add_info(cls, *messages, **kwargs):
         """
         Add the given `info` to any exceptions derived from this class that are 
@@ -125,11 +121,7 @@ class Error(Exception):
         parameter.  The `nested_data` attribute, in contrast, provides access 
         to all values for each parameter.
         """
-        try:
-            cls.push_info(*messages, **kwargs)
-            yield
-        finally:
-            cls.pop_info()
+        return _add_info(cls, messages, kwargs)
 
     @classmethod
     def push_info(cls, *messages, **kwargs):
@@ -169,13 +161,12 @@ class Error(Exception):
 
         This is the opposite of `push_info()`.
         """
-        for i, (cls_i, _, _) in reversed(list(enumerate(_info_stack))):
-            if cls_i is cls:
-                break
-        else:
-            raise IndexError(f"no info to pop for {cls}")
+        for i in range(len(_info_stack) - 1, -1, -1):
+            if _info_stack[i][0] is cls:
+                del _info_stack[i]
+                return
 
-        del _info_stack[i]
+        raise IndexError(f"no info to pop for {cls}")
 
     @classmethod
     def clear_info(cls):
@@ -183,8 +174,7 @@ class Error(Exception):
         Stop adding any `info` that was "pushed" to exceptions derived from 
         this class.
         """
-        global _info_stack
-        _info_stack = [x for x in _info_stack if x[0] is not cls]
+        _info_stack[:] = [x for x in _info_stack if x[0] is not cls]
 
     def put_info(self, *messages, **kwargs):
         i = len(self._data)
@@ -220,8 +210,8 @@ class Error(Exception):
 
         # `info_stack` is in the order that the messages will appear in, i.e.  
         # oldest first.  This is a little inconvenient for `data_view`, because 
-        # it means that `ChainMap` naturally reads in the wrong direction, but 
-        # `data_view` handles this internally using `reverse_view`.
+        # it means that the most recent values are at the end, but `data_view` 
+        # handles this internally by searching the stack backwards.
 
         self._brief = brief
         self._info = []
@@ -229,16 +219,25 @@ class Error(Exception):
         self._hints = list_iadd()
         self._data = []
 
-        for cls, msgs, kws in _info_stack:
-            if isinstance(self, cls):
-                self.put_info(*msgs, **kws)
+        # This is the same as calling `put_info()` for each relevant layer, but 
+        # without the overhead of the method call.  Copy the parameters, 
+        # because the views allow them to be modified.  The stack is usually 
+        # empty, so check that first.
+        if _info_stack:
+            for cls, msgs, kws in _info_stack:
+                if isinstance(self, cls):
+                    i = len(self._data)
+                    self._info.extend((i, m) for m in msgs)
+                    self._data.append(dict(kws))
 
         self._data.append(kwargs)
         self._ctor_data = kwargs
 
-        self._info_view = info_view(self._info)
-        self._data_view = data_view(self._data)
-        self._nested_data_view = nested_data_view(self._data)
+        # Most exceptions are caught without ever being formatted or 
+        # inspected, so don't create the views until they're needed.
+        self._info_view = None
+        self._data_view = None
+        self._nested_data_view = None
 
     def __str__(self):
         """
@@ -254,7 +253,7 @@ class Error(Exception):
         # failed>".  This isn't very helpful, so here we manually format the 
         # stack trace and display it to the user.
         try:
-            message = ""
+            lines = []
             parts = [
                     ('',  [self.brief_str]),
                     (self.info_bullet, self.info_strs),
@@ -266,11 +265,14 @@ class Error(Exception):
                 b = len(bullet)
 
                 for s in strs:
-                    s = textwrap.indent(s, b*' ')
-                    s = bullet + s[b:]
-                    message += s + '\n'
+                    # Most messages are a single line, and don't need to be 
+                    # indented at all.
+                    if '\n' in s:
+                        s = textwrap.indent(s, b*' ')[b:]
+
+                    lines.append(bullet + s)
 
-            return message
+            return '\n'.join(lines) + '\n'
 
         except Exception as err:
             # Using format_exc() seems to sometimes trigger stack overflows 
@@ -371,6 +373,8 @@ class Error(Exception):
             • b: 2,3
 
         """
+        if self._info_view is None:
+            self._info_view = info_view(self._info)
         return self._info_view
 
     @property
@@ -378,10 +382,18 @@ class Error(Exception):
         """
         The `info` messages, with all parameter substitution performed.
         """
-        return flatten(
-                eval_template(x, self.nested_data.flatten(i))
-                for i, x in self._info
-        )
+        nested_data = self.nested_data
+        layers = {}
+        strs = []
+
+        # Many templates share the same layer, e.g. all those added directly 
+        # to the exception (rather than via `add_info()`) use layer -1.
+        for i, x in self._info:
+            if i not in layers:
+                layers[i] = nested_data.flatten(i)
+            strs.append(eval_template(x, layers[i]))
+
+        return flatten(strs)
 
     @property_iadd
     def blame(self):
@@ -416,7 +428,8 @@ class Error(Exception):
         """
         The `blame` messages, with all parameter substitution performed.
         """
-        return flatten(eval_template(x, self.data) for x in self.blame)
+        data = self.data
+        return flatten(eval_template(x, data) for x in self._blame)
 
     @property_iadd
     def hints(self):
@@ -451,7 +464,8 @@ class Error(Exception):
         """
         The `hints` messages, with all parameter substitution performed.
         """
-        return flatten(eval_template(x, self.data) for x in self.hints)
+        data = self.data
+        return flatten(eval_template(x, data) for x in self._hints)
 
     @property
     def data(self):
@@ -480,6 +494,8 @@ class Error(Exception):
             2
 
         """
+        if self._data_view is None:
+            self._data_view = data_view(self._data)
         return self._data_view
 
     @data.setter
@@ -529,6 +545,24 @@ class Error(Exception):
         can be used to get the index corresponding to any info message 
         template.
         """
+        if self._nested_data_view is None:
+            self._nested_data_view = nested_data_view(self._data)
         return self._nested_data_view
 
 
+class _add_info(ContextDecorator):
+    # This behaves like a `@contextmanager` function (including being usable 
+    # as a decorator), but is much faster to enter and exit.  That matters 
+    # because `add_info()` is often used inside loops, e.g. to record which 
+    # line of a file is being parsed.
+
+    def __init__(self, cls, messages, kwargs):
+        self.cls = cls
+        self.messages = messages
+        self.kwargs = kwargs
+
+    def __enter__(self):
+        self.cls.push_info(*self.messages, **self.kwargs)
+
+    def __exit__(self, *args):
+        self.cls.pop_info()
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import functools
-from traceback import format_exc
 
 class only_raise:
     """
@@ -33,6 +32,7 @@ class only_raise:
 
 
 class iadd_mixin:
+    __slots__ = ()
 
     def __iadd__(self, other):
         if callable(other) or isinstance(other, str):
@@ -42,7 +42,7 @@ class iadd_mixin:
         return self
 
 class list_iadd(iadd_mixin, list):
-    pass
+    __slots__ = ()
 
 def property_iadd(getter):
     # Provide a more helpful error message if the user forgets to use `+=`.
@@ -56,8 +56,13 @@ def property_iadd(getter):
 def eval_template(template, data):
     if callable(template):
         return template(data)
-    else:
-        return template.format_map(data)
+
+    # Many templates are fixed strings, so don't bother parsing them.  Braces 
+    # of either kind mean that formatting might change the string.
+    if '{' not in template and '}' not in template:
+        return template
+
+    return template.format_map(data)
 
 def flatten(nested):
     """
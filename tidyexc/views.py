@@ -1,56 +1,58 @@
 #!/usr/bin/env python3
 
-from collections import ChainMap
-from collections.abc import Sequence, MutableSequence, MutableMapping
+from collections.abc import MutableSequence, MutableMapping
 from .utils import iadd_mixin
 
 class data_view(MutableMapping):
+    __slots__ = ('__data_stack',)
 
     def __init__(self, data_stack):
         # Don't trigger `__setattr__()`, and use name-mangling to avoid 
         # clashing with user-set attributes.
-        self.__dict__['_data_view__data'] = ChainMap()
-        self.__data.maps = reverse_view(data_stack)
+        object.__setattr__(self, '_data_view__data_stack', data_stack)
 
     def __repr__(self):
-        return f'data_view({self.__data.maps.items!r})'
-
-    def __eq__(self, other):
-        return self.__data == other
+        return f'data_view({self.__data_stack!r})'
 
     def __len__(self):
-        return len(self.__data)
+        return len(set().union(*self.__data_stack))
 
     def __iter__(self):
-        return iter(self.__data)
+        keys = {}
+        for d in self.__data_stack:
+            keys.update(dict.fromkeys(d))
+        return iter(keys)
 
     def __contains__(self, key):
-        return key in self.__data
+        return any(key in d for d in self.__data_stack)
 
     def __getitem__(self, key):
-        return self.__data[key]
+        # The stack is oldest-first, so search it backwards to find the most 
+        # recent value.
+        for d in reversed(self.__data_stack):
+            if key in d:
+                return d[key]
+
+        raise KeyError(key)
 
     def __setitem__(self, key, value):
-        self.__data[key] = value
+        self.__data_stack[-1][key] = value
 
     def __delitem__(self, key):
-        del self.__data[key]
+        del self.__data_stack[-1][key]
 
     def __getattr__(self, key):
         try:
-            return self.__data[key]
+            return self[key]
         except KeyError:
-            pass
-
-        # Raise the standard exception.
-        return super().__getattr__(key)
+            raise AttributeError(key) from None
 
     def __setattr__(self, key, value):
-        self.__data[key] = value
+        self[key] = value
 
     def __delattr__(self, key):
         try:
-            del self.__data[key]
+            del self[key]
             return
         except KeyError:
             pass
@@ -59,6 +61,7 @@ class data_view(MutableMapping):
         return super().__delattr__(key)
 
 class nested_data_view:
+    __slots__ = ('_data_stack',)
 
     def __init__(self, data_stack):
         self._data_stack = data_stack
@@ -69,13 +72,16 @@ class nested_data_view:
     def __getitem__(self, key):
         if isinstance(key, tuple):
             hits = []
+            merged = {}
 
-            for i, d in enumerate(self._data_stack):
-                if any(k in d for k in key):
-                    v = self.flatten(i)
+            # Keep a running merge of the layers seen so far, rather than 
+            # flattening the stack from scratch for each layer.
+            for d in self._data_stack:
+                merged.update(d)
 
+                if any(k in d for k in key):
                     try:
-                        hit = tuple(v[k] for k in key)
+                        hit = tuple(merged[k] for k in key)
                         hits.append(hit)
                     except KeyError:
                         pass
@@ -104,6 +110,7 @@ class nested_data_view:
         return data_view(self._data_stack[:layer+1])
 
 class info_view(iadd_mixin, MutableSequence):
+    __slots__ = ('_info_pairs',)
 
     def __init__(self, info_pairs):
         self._info_pairs = info_pairs  # list of (index, template) pairs
@@ -134,20 +141,3 @@ class info_view(iadd_mixin, MutableSequence):
 
     def layers(self):
         return self._info_pairs
-
-class reverse_view(Sequence):
-
-    def __init__(self, items):
-        self.items = items
-
-    def __repr__(self):
-        items_str = ', '.join(repr(x) for x in self)
-        return f'[{items_str}]'
-
-    def __getitem__(self, i):
-        return self.items[-i - 1]
-
-    def __len__(self):
-        return len(self.items)
-
-